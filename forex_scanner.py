@@ -4,119 +4,665 @@ Forex Scanner - Live Currency Exchange Rate Monitor
 Fetches real-time exchange rates for multiple currency pairs using Alpha Vantage API
 """
 
-import requests
+import asyncio
+import atexit
+import io
+import itertools
+import operator
+import pathlib
+import sys
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from urllib.parse import urlencode
+
+import orjson
 import time
-from datetime import datetime
 from typing import Dict, List, Optional
-import json
+
+# Heavy HTTP clients are imported on first use so start-up and early
+# exits (bad API key, cancelled scan) stay instant
+requests = None
+HTTPAdapter = None
+Retry = None
+aiohttp = None
+httpx = None
+AsyncLimiter = None
+
+
+def _import_requests():
+    """Import requests, its HTTPAdapter and urllib3's Retry on first use"""
+    global requests, HTTPAdapter, Retry
+    if requests is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+
+def _import_async_clients():
+    """Import the async HTTP stack on first use, preferring httpx (HTTP/2)"""
+    global aiohttp, httpx, AsyncLimiter
+    if AsyncLimiter is None:
+        from aiolimiter import AsyncLimiter
+        try:
+            import httpx
+        except ImportError:
+            import aiohttp
+
+
+@dataclass(slots=True)
+class Rate:
+    """Single exchange rate quote for one currency pair"""
+
+    frm: str
+    frm_name: str
+    to: str
+    to_name: str
+    rate: float
+    last_refreshed: str
+    timezone: str
+    bid: float
+    ask: float
+
+
+# Scan progress lines are buffered and flushed to stdout in batches of
+# this size, instead of one syscall-plus-lock per print
+_FLUSH_EVERY = 20
+
+# One results-table row; a single format call per row instead of three
+# float formats plus alignment concatenation
+_ROW_FMT = '{pair:<15} {rate:<12.5f} {bid:<12.5f} {ask:<12.5f} {updated:<20}'
+
+# Table borders, built once instead of re-multiplied in every hot
+# output path
+_BORDER = '=' * 70
+_RULE = '-' * 70
+
+_BANNER = """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                     FOREX SCANNER v1.0                       ║
+    ║              Live Currency Exchange Rate Monitor             ║
+    ╚══════════════════════════════════════════════════════════════╝
+    """
+
+
+class _TokenBucket:
+    """Token bucket used to pace API calls across worker threads"""
+
+    def __init__(self, tokens: int, per: float):
+        self.capacity = tokens
+        self.tokens = float(tokens)
+        self.per = per
+        self.lock = threading.Lock()
+        self.last = time.monotonic()
+
+    def acquire(self):
+        """Block until a token is available, then consume it"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    self.capacity,
+                    self.tokens + self.capacity * (now - self.last) / self.per
+                )
+                self.last = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) * self.per / self.capacity
+            time.sleep(wait)
 
 
 class ForexScanner:
     """Main class for scanning forex exchange rates"""
 
     BASE_URL = "https://www.alphavantage.co/query"
-
-    def __init__(self, api_key: str):
+    CACHE_PATH = pathlib.Path.home() / '.cache' / 'forex_scanner.json'
+
+    # Response schema, fetched in one C-level call instead of nine subscripts
+    _RATE_KEYS = (
+        '1. From_Currency Code',
+        '2. From_Currency Name',
+        '3. To_Currency Code',
+        '4. To_Currency Name',
+        '5. Exchange Rate',
+        '6. Last Refreshed',
+        '7. Time Zone',
+        '8. Bid Price',
+        '9. Ask Price'
+    )
+    _RATE_GETTER = operator.itemgetter(*_RATE_KEYS)
+
+    # Top-level keys the API uses to report errors and rate limiting; one
+    # set intersection spots them instead of chained membership checks
+    _BAD_KEYS = frozenset({'Error Message', 'Note', 'Information'})
+
+    def __init__(self, api_key: str, cache_ttl: float = 30.0,
+                 jsonl_path: Optional[str] = None):
         """
         Initialize the Forex Scanner
 
         Args:
             api_key: Your Alpha Vantage API key from alphavantage.co
+            cache_ttl: Seconds a fetched rate stays valid before re-fetching
+            jsonl_path: Optional file every fetched rate is appended to as
+                        one JSON line, so long runs keep a full history on
+                        disk while memory stays bounded
         """
+        _import_requests()
+
         self.api_key = api_key
-        self.cache = {}
+        self.cache_ttl = cache_ttl
+        self._jsonl = open(jsonl_path, 'ab') if jsonl_path else None
+
+        # TTL cache: (FROM, TO) -> (fetch timestamp, rate data), persisted
+        # across runs so re-scans within the TTL skip the network entirely
+        self.cache: Dict[tuple, tuple] = {}
+        self._load_cache()
+        atexit.register(self._save_cache)
+
+        # Persistent session: keeps the TLS connection to alphavantage.co
+        # alive across calls instead of re-handshaking on every request.
+        # Transient 5xx answers are retried with exponential backoff
+        # (0.5, 1.0, 2.0 s), staying within one rate-limit slot
+        retry = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET'])
+        )
+        self.session = requests.Session()
+        self.session.mount(
+            'https://',
+            HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retry)
+        )
+        self.session.headers.update({
+            'User-Agent': 'forex-scanner/1.0',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+
+    def close(self):
+        """Close the underlying HTTP session and the JSONL log, if any"""
+        self.session.close()
+        if self._jsonl is not None:
+            self._jsonl.close()
+
+    def _load_cache(self):
+        """Load still-fresh cache entries persisted by a previous run"""
+        import mmap
+
+        # Map the file instead of reading it: pages are faulted in as
+        # orjson's C parser walks them, and nothing is copied up front
+        try:
+            with open(self.CACHE_PATH, 'rb') as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            return
 
-    def get_exchange_rate(self, from_currency: str, to_currency: str) -> Optional[Dict]:
+        view = memoryview(mm)
+        try:
+            stored = orjson.loads(view)
+        except orjson.JSONDecodeError:
+            return
+        finally:
+            view.release()
+            mm.close()
+
+        # A cache file of unexpected shape (hand-edited, or written by an
+        # older version with different Rate fields) just means a cold start
+        now = time.time()
+        try:
+            for pair, (fetched_at, rate_data) in stored.items():
+                if now - fetched_at < self.cache_ttl:
+                    from_curr, to_curr = pair.split('/')
+                    self.cache[(from_curr, to_curr)] = (fetched_at, Rate(**rate_data))
+        except (TypeError, ValueError, AttributeError):
+            self.cache.clear()
+
+    def _save_cache(self):
+        """Persist the cache so re-runs within the TTL skip the API"""
+        if not self.cache:
+            return
+
+        stored = {
+            f"{from_curr}/{to_curr}": (fetched_at, asdict(rate_data))
+            for (from_curr, to_curr), (fetched_at, rate_data) in self.cache.items()
+        }
+
+        try:
+            self.CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            self.CACHE_PATH.write_bytes(orjson.dumps(stored))
+        except (OSError, orjson.JSONEncodeError):
+            pass
+
+    def _build_url(self, from_currency: str, to_currency: str) -> str:
+        """Build the full CURRENCY_EXCHANGE_RATE request URL for a pair"""
+        query = urlencode({
+            'function': 'CURRENCY_EXCHANGE_RATE',
+            'from_currency': from_currency,
+            'to_currency': to_currency,
+            'apikey': self.api_key
+        })
+        return f"{self.BASE_URL}?{query}"
+
+    def get_exchange_rate(self, from_currency: str, to_currency: str,
+                          _url: Optional[str] = None) -> Optional[Rate]:
         """
         Get exchange rate for a currency pair
 
         Args:
             from_currency: Base currency code (e.g., 'USD')
             to_currency: Quote currency code (e.g., 'EUR')
+            _url: Precomputed request URL for already-normalized pairs,
+                  skipping the per-call dict build and urlencode
 
         Returns:
-            Dictionary with exchange rate data or None if request fails
+            Rate with the exchange rate data or None if request fails
         """
-        params = {
-            'function': 'CURRENCY_EXCHANGE_RATE',
-            'from_currency': from_currency.upper(),
-            'to_currency': to_currency.upper(),
-            'apikey': self.api_key
-        }
+        key = (from_currency.upper(), to_currency.upper())
+
+        entry = self.cache.get(key)
+        if entry and time.time() - entry[0] < self.cache_ttl:
+            return entry[1]
+
+        if _url is None:
+            _url = self._build_url(*key)
 
         try:
-            response = requests.get(self.BASE_URL, params=params, timeout=10)
+            response = self.session.get(_url, timeout=10)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
+        except requests.exceptions.RequestException as e:
+            print(f"❌ Network error: {e}")
+            return None
+        except orjson.JSONDecodeError as e:
+            print(f"❌ Data parsing error: {e}")
+            return None
 
-            # Check for API errors
-            if 'Error Message' in data:
-                print(f"❌ Error: {data['Error Message']}")
-                return None
+        result = self._parse_rate_payload(data, from_currency, to_currency)
 
-            if 'Note' in data:
-                print(f"⚠️  API Limit: {data['Note']}")
-                return None
+        if result:
+            self.cache[key] = (time.time(), result)
 
-            if 'Realtime Currency Exchange Rate' not in data:
-                print(f"❌ Invalid response for {from_currency}/{to_currency}")
-                return None
+        return result
 
-            rate_data = data['Realtime Currency Exchange Rate']
-
-            return {
-                'from': rate_data['1. From_Currency Code'],
-                'from_name': rate_data['2. From_Currency Name'],
-                'to': rate_data['3. To_Currency Code'],
-                'to_name': rate_data['4. To_Currency Name'],
-                'rate': float(rate_data['5. Exchange Rate']),
-                'last_refreshed': rate_data['6. Last Refreshed'],
-                'timezone': rate_data['7. Time Zone'],
-                'bid': float(rate_data['8. Bid Price']),
-                'ask': float(rate_data['9. Ask Price'])
-            }
+    def _check_api_error(self, data: Dict) -> bool:
+        """Report an error or rate-limit payload; True if one was present"""
+        bad = self._BAD_KEYS & data.keys()
+        if not bad:
+            return False
+
+        key = next(iter(bad))
+        if key == 'Error Message':
+            print(f"❌ Error: {data[key]}")
+        else:
+            print(f"⚠️  API Limit: {data[key]}")
+        return True
+
+    def _parse_rate_payload(self, data: Dict, from_currency: str, to_currency: str) -> Optional[Rate]:
+        """
+        Validate an API response body and extract the exchange rate fields
+
+        Args:
+            data: Decoded JSON response from the API
+            from_currency: Base currency code, for error messages
+            to_currency: Quote currency code, for error messages
+
+        Returns:
+            Rate with the exchange rate data or None if the response is bad
+        """
+        # Check for API errors
+        if self._check_api_error(data):
+            return None
+
+        if 'Realtime Currency Exchange Rate' not in data.keys():
+            print(f"❌ Invalid response for {from_currency}/{to_currency}")
+            return None
+
+        rate_data = data['Realtime Currency Exchange Rate']
+
+        try:
+            (frm, frm_name, to, to_name, rate,
+             last_refreshed, timezone, bid, ask) = self._RATE_GETTER(rate_data)
+            return Rate(
+                frm=frm,
+                frm_name=frm_name,
+                to=to,
+                to_name=to_name,
+                rate=float(rate),
+                last_refreshed=last_refreshed,
+                timezone=timezone,
+                bid=float(bid),
+                ask=float(ask)
+            )
+        except (KeyError, ValueError) as e:
+            print(f"❌ Data parsing error: {e}")
+            return None
 
+    def _get_intraday_rate(self, from_currency: str, to_currency: str) -> Optional[Rate]:
+        """
+        Get the newest 1-minute FX_INTRADAY bar as the current rate
+
+        Args:
+            from_currency: Base currency code, already upper-cased
+            to_currency: Quote currency code, already upper-cased
+
+        Returns:
+            Rate built from the latest intraday bar or None if request fails
+        """
+        params = {
+            'function': 'FX_INTRADAY',
+            'from_symbol': from_currency,
+            'to_symbol': to_currency,
+            'interval': '1min',
+            'outputsize': 'compact',
+            'apikey': self.api_key
+        }
+
+        try:
+            response = self.session.get(self.BASE_URL, params=params, timeout=10)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
             print(f"❌ Network error: {e}")
             return None
-        except (KeyError, ValueError, json.JSONDecodeError) as e:
+        except orjson.JSONDecodeError as e:
+            print(f"❌ Data parsing error: {e}")
+            return None
+
+        if self._check_api_error(data):
+            return None
+
+        series = data.get('Time Series FX (1min)')
+        if not series:
+            print(f"❌ Invalid response for {from_currency}/{to_currency}")
+            return None
+
+        try:
+            latest = max(series)  # Timestamps are ISO strings, so max is newest
+            close = float(series[latest]['4. close'])
+        except (KeyError, ValueError) as e:
             print(f"❌ Data parsing error: {e}")
             return None
 
-    def scan_pairs(self, currency_pairs: List[tuple], delay: float = 12.0) -> Dict:
+        timezone = data.get('Meta Data', {}).get('7. Time Zone', 'UTC')
+
+        # Intraday bars carry no bid/ask, so the close stands in for both
+        return Rate(
+            frm=from_currency,
+            frm_name=from_currency,
+            to=to_currency,
+            to_name=to_currency,
+            rate=close,
+            last_refreshed=latest,
+            timezone=timezone,
+            bid=close,
+            ask=close
+        )
+
+    def get_rates_batch(self, currency_pairs: List[tuple], rate_limit: int = 5,
+                        per: float = 60.0) -> Dict:
         """
-        Scan multiple currency pairs
+        Fetch current rates for multiple pairs via the FX_INTRADAY endpoint
+
+        One FX_INTRADAY call returns a whole time series per pair; its newest
+        bar stands in for the realtime quote. All calls reuse the session's
+        pooled TLS connection, and on tiers whose endpoints batch several
+        symbols per request this amortizes per-call overhead further. Results
+        land in the TTL cache like realtime quotes, and a token bucket paces
+        the uncached fetches at the API rate limit.
 
         Args:
             currency_pairs: List of tuples with (from_currency, to_currency)
-            delay: Delay between API calls in seconds (free tier: 5 calls/min)
+            rate_limit: Calls allowed per window (free tier: 5 per minute)
+            per: Rate window length in seconds
 
         Returns:
-            Dictionary with results for all pairs
+            Dictionary with results for all pairs that resolved
         """
         results = {}
-        total_pairs = len(currency_pairs)
+        bucket = _TokenBucket(rate_limit, per)
 
-        print(f"\n{'='*70}")
-        print(f"🔍 FOREX SCANNER - Starting scan of {total_pairs} currency pairs")
-        print(f"{'='*70}\n")
+        for from_curr, to_curr in currency_pairs:
+            key = (from_curr.upper(), to_curr.upper())
 
-        for idx, (from_curr, to_curr) in enumerate(currency_pairs, 1):
-            pair_name = f"{from_curr}/{to_curr}"
-            print(f"[{idx}/{total_pairs}] Fetching {pair_name}...", end=' ')
+            entry = self.cache.get(key)
+            if entry and time.time() - entry[0] < self.cache_ttl:
+                results[f"{from_curr}/{to_curr}"] = entry[1]
+                continue
+
+            bucket.acquire()
+            rate_data = self._get_intraday_rate(*key)
+            if rate_data:
+                self.cache[key] = (time.time(), rate_data)
+                results[f"{from_curr}/{to_curr}"] = rate_data
+
+        return results
+
+    def _record_result(self, results: OrderedDict, pair_name: str, rate_data: Rate,
+                       max_keep: Optional[int]):
+        """Store a result in the bounded window and tee it to the JSONL log"""
+        results[pair_name] = rate_data
+
+        if max_keep is not None:
+            while len(results) > max_keep:
+                results.popitem(last=False)
+
+        if self._jsonl is not None:
+            self._jsonl.write(orjson.dumps(asdict(rate_data)) + b'\n')
+
+    def _fetch_one(self, from_currency: str, to_currency: str,
+                   bucket: _TokenBucket, url: Optional[str] = None) -> Optional[Rate]:
+        """Fetch one pair after acquiring a rate-limit token
+
+        Cache hits are served before touching the bucket, so a re-scan of
+        still-fresh pairs spends no tokens and no wall-clock on them.
+        """
+        key = (from_currency.upper(), to_currency.upper())
+
+        entry = self.cache.get(key)
+        if entry and time.time() - entry[0] < self.cache_ttl:
+            return entry[1]
+
+        bucket.acquire()
+        return self.get_exchange_rate(from_currency, to_currency, _url=url)
+
+    def scan_pairs(self, currency_pairs: List[tuple], rate_limit: int = 5,
+                   per: float = 60.0, max_keep: Optional[int] = None) -> Dict:
+        """
+        Scan multiple currency pairs concurrently
+
+        Requests fan out over a thread pool sharing the session's connection
+        pool; a token bucket paces calls at the API rate limit, so threads
+        overlap network latency instead of sleeping between serial requests.
+        The bucket refills continuously, so request time counts toward the
+        wait and the whole rate window is used instead of a fixed delay.
+
+        Args:
+            currency_pairs: List of tuples with (from_currency, to_currency)
+            rate_limit: Calls allowed per window (free tier: 5 per minute)
+            per: Rate window length in seconds
+            max_keep: Keep only the newest N results in memory; older ones
+                      are evicted (and survive in the JSONL log, if enabled)
+
+        Returns:
+            Dictionary with results for all pairs in the kept window
+        """
+        # Normalize once and precompute each pair's request URL, instead of
+        # re-uppercasing and re-encoding the querystring on every call
+        pairs = [(from_curr.upper(), to_curr.upper()) for from_curr, to_curr in currency_pairs]
+
+        results = OrderedDict()
+        total_pairs = len(pairs)
+
+        out = io.StringIO()
+        out.write(f"\n{_BORDER}\n"
+                  f"🔍 FOREX SCANNER - Starting scan of {total_pairs} currency pairs\n"
+                  f"{_BORDER}\n\n")
+
+        bucket = _TokenBucket(rate_limit, per)
+        completed = 0
+
+        with ThreadPoolExecutor(max_workers=rate_limit) as pool:
+            futures = {
+                pool.submit(self._fetch_one, from_curr, to_curr, bucket,
+                            self._build_url(from_curr, to_curr)): f"{from_curr}/{to_curr}"
+                for from_curr, to_curr in pairs
+            }
+
+            for future in as_completed(futures):
+                pair_name = futures[future]
+                completed += 1
+                rate_data = future.result()
+
+                if rate_data:
+                    self._record_result(results, pair_name, rate_data, max_keep)
+                    out.write(f"[{completed}/{total_pairs}] {pair_name}: ✓ {rate_data.rate:.4f}\n")
+                else:
+                    out.write(f"[{completed}/{total_pairs}] {pair_name}: ✗ Failed\n")
+
+                if completed % _FLUSH_EVERY == 0:
+                    sys.stdout.write(out.getvalue())
+                    out.seek(0)
+                    out.truncate()
+
+        sys.stdout.write(out.getvalue())
+        return results
+
+    async def _fetch_async(self, session, sem, limiter, from_currency: str,
+                           to_currency: str) -> Optional[Rate]:
+        """
+        Fetch a single pair inside the shared semaphore and rate limiter
+
+        Args:
+            session: Shared aiohttp ClientSession
+            sem: Semaphore capping in-flight requests
+            limiter: AsyncLimiter enforcing the API rate limit
+            from_currency: Base currency code (e.g., 'USD')
+            to_currency: Quote currency code (e.g., 'EUR')
+
+        Returns:
+            Rate with the exchange rate data or None if request fails
+        """
+        params = {
+            'function': 'CURRENCY_EXCHANGE_RATE',
+            'from_currency': from_currency.upper(),
+            'to_currency': to_currency.upper(),
+            'apikey': self.api_key
+        }
+
+        async with sem:
+            async with limiter:
+                try:
+                    async with session.get(self.BASE_URL, params=params) as response:
+                        response.raise_for_status()
+                        data = orjson.loads(await response.read())
+                except (aiohttp.ClientError, asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+                    print(f"❌ Network error for {from_currency}/{to_currency}: {e}")
+                    return None
+
+        return self._parse_rate_payload(data, from_currency, to_currency)
+
+    async def _fetch_http2(self, client, limiter, from_currency: str,
+                           to_currency: str) -> Optional[Rate]:
+        """
+        Fetch a single pair over the shared HTTP/2 client
+
+        Args:
+            client: Shared httpx AsyncClient
+            limiter: AsyncLimiter enforcing the API rate limit
+            from_currency: Base currency code (e.g., 'USD')
+            to_currency: Quote currency code (e.g., 'EUR')
+
+        Returns:
+            Rate with the exchange rate data or None if request fails
+        """
+        params = {
+            'function': 'CURRENCY_EXCHANGE_RATE',
+            'from_currency': from_currency.upper(),
+            'to_currency': to_currency.upper(),
+            'apikey': self.api_key
+        }
+
+        async with limiter:
+            try:
+                response = await client.get(self.BASE_URL, params=params)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            except (httpx.HTTPError, orjson.JSONDecodeError) as e:
+                print(f"❌ Network error for {from_currency}/{to_currency}: {e}")
+                return None
 
-            rate_data = self.get_exchange_rate(from_curr, to_curr)
+        return self._parse_rate_payload(data, from_currency, to_currency)
+
+    async def _run_all_async(self, currency_pairs: List[tuple]) -> List[Optional[Rate]]:
+        """Fan all pair fetches out over one pooled connection"""
+        _import_async_clients()
+
+        limiter = AsyncLimiter(5, 60)  # Free tier: 5 calls/min
+
+        if httpx is not None:
+            # HTTP/2 multiplexes all in-flight requests over one TLS
+            # connection, with HPACK compressing the repeated headers
+            async with httpx.AsyncClient(
+                http2=True, timeout=10,
+                headers={'Accept-Encoding': 'gzip, deflate'}
+            ) as client:
+                return await asyncio.gather(*[
+                    self._fetch_http2(client, limiter, from_curr, to_curr)
+                    for from_curr, to_curr in currency_pairs
+                ])
+
+        sem = asyncio.Semaphore(5)
+        connector = aiohttp.TCPConnector(limit_per_host=5)
+        timeout = aiohttp.ClientTimeout(total=10)
+
+        # auto_decompress (the default) transparently inflates the bodies
+        async with aiohttp.ClientSession(
+            connector=connector, timeout=timeout, auto_decompress=True,
+            headers={'Accept-Encoding': 'gzip, deflate'}
+        ) as session:
+            tasks = [
+                self._fetch_async(session, sem, limiter, from_curr, to_curr)
+                for from_curr, to_curr in currency_pairs
+            ]
+            return await asyncio.gather(*tasks)
+
+    def scan_pairs_async(self, currency_pairs: List[tuple],
+                         max_keep: Optional[int] = None) -> Dict:
+        """
+        Scan multiple currency pairs concurrently
+
+        Requests run in parallel over a single pooled connection; the rate
+        limiter enforces API pacing, so no fixed sleep between calls is needed.
+
+        Args:
+            currency_pairs: List of tuples with (from_currency, to_currency)
+            max_keep: Keep only the newest N results in memory; older ones
+                      are evicted (and survive in the JSONL log, if enabled)
+
+        Returns:
+            Dictionary with results for all pairs in the kept window
+        """
+        results = OrderedDict()
+        total_pairs = len(currency_pairs)
+
+        lines = [f"\n{_BORDER}\n"
+                 f"🔍 FOREX SCANNER - Starting scan of {total_pairs} currency pairs\n"
+                 f"{_BORDER}\n"]
+
+        fetched = asyncio.run(self._run_all_async(currency_pairs))
 
+        for idx, ((from_curr, to_curr), rate_data) in enumerate(zip(currency_pairs, fetched), 1):
+            pair_name = f"{from_curr}/{to_curr}"
             if rate_data:
-                results[pair_name] = rate_data
-                print(f"✓ {rate_data['rate']:.4f}")
+                self._record_result(results, pair_name, rate_data, max_keep)
+                lines.append(f"[{idx}/{total_pairs}] {pair_name}: ✓ {rate_data.rate:.4f}")
             else:
-                print(f"✗ Failed")
-
-            # Rate limiting: Wait before next request (except for last pair)
-            if idx < total_pairs:
-                time.sleep(delay)
+                lines.append(f"[{idx}/{total_pairs}] {pair_name}: ✗ Failed")
 
+        sys.stdout.write('\n'.join(lines) + '\n')
         return results
 
     def display_results(self, results: Dict):
@@ -130,24 +676,33 @@ class ForexScanner:
             print("\n❌ No results to display")
             return
 
-        print(f"\n{'='*70}")
-        print(f"📊 FOREX SCANNER RESULTS - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        print(f"{'='*70}\n")
+        from datetime import datetime
 
-        # Header
-        print(f"{'PAIR':<15} {'RATE':<12} {'BID':<12} {'ASK':<12} {'UPDATED':<20}")
-        print(f"{'-'*70}")
+        rows = [
+            '',
+            _BORDER,
+            f"📊 FOREX SCANNER RESULTS - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            _BORDER,
+            '',
+            f"{'PAIR':<15} {'RATE':<12} {'BID':<12} {'ASK':<12} {'UPDATED':<20}",
+            _RULE
+        ]
 
         # Data rows
         for pair_name, data in results.items():
-            rate = f"{data['rate']:.5f}"
-            bid = f"{data['bid']:.5f}"
-            ask = f"{data['ask']:.5f}"
-            updated = data['last_refreshed']
+            rows.append(_ROW_FMT.format(
+                pair=pair_name,
+                rate=data.rate,
+                bid=data.bid,
+                ask=data.ask,
+                updated=data.last_refreshed
+            ))
 
-            print(f"{pair_name:<15} {rate:<12} {bid:<12} {ask:<12} {updated:<20}")
+        rows.append(_BORDER)
+        rows.append('')
 
-        print(f"{'='*70}\n")
+        # Whole table goes out in one write instead of one print per row
+        sys.stdout.write('\n'.join(rows) + '\n')
 
     def calculate_arbitrage(self, results: Dict):
         """
@@ -157,27 +712,31 @@ class ForexScanner:
             results: Dictionary of scan results
         """
         print("💡 Arbitrage Analysis:")
-        print("-" * 70)
+        print(_RULE)
 
-        # Look for triangular arbitrage opportunities
-        pairs_dict = {pair: data['rate'] for pair, data in results.items()}
+        # Build a directed rate graph; each quoted pair implies its inverse
+        graph: Dict[str, Dict[str, float]] = defaultdict(dict)
+        for pair, data in results.items():
+            from_curr, to_curr = pair.split('/')
+            graph[from_curr][to_curr] = data.rate
+            graph[to_curr][from_curr] = 1.0 / data.rate
 
         # Example: USD/EUR * EUR/GBP * GBP/USD should equal 1 (or close to it)
-        # Simplified check for demonstration
+        # Only true 3-cycles A -> B -> C -> A are checked
         opportunities = []
 
-        for pair1, rate1 in pairs_dict.items():
-            for pair2, rate2 in pairs_dict.items():
-                if pair1 != pair2:
-                    # Calculate spread
-                    spread = abs((rate1 * rate2) - 1.0)
-                    if spread > 0.01:  # Threshold for potential opportunity
-                        opportunities.append((pair1, pair2, spread))
+        for a, b, c in itertools.combinations(graph, 3):
+            if b in graph[a] and c in graph[b] and a in graph[c]:
+                product = graph[a][b] * graph[b][c] * graph[c][a]
+                edge = product - 1.0
+                if abs(edge) > 0.001:  # Threshold for potential opportunity
+                    opportunities.append((a, b, c, edge))
 
         if opportunities:
+            opportunities.sort(key=lambda opp: abs(opp[3]), reverse=True)
             print("⚠️  Potential opportunities detected (further analysis required):")
-            for p1, p2, spread in opportunities[:5]:  # Show top 5
-                print(f"  • {p1} × {p2} - Spread: {spread:.4f}")
+            for a, b, c, edge in opportunities[:5]:  # Show top 5
+                print(f"  • {a} → {b} → {c} → {a} - Edge: {edge:+.4f}")
         else:
             print("✓ No significant arbitrage opportunities detected")
 
@@ -187,12 +746,7 @@ class ForexScanner:
 def main():
     """Main function to run the Forex Scanner"""
 
-    print("""
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                     FOREX SCANNER v1.0                       ║
-    ║              Live Currency Exchange Rate Monitor             ║
-    ╚══════════════════════════════════════════════════════════════╝
-    """)
+    print(_BANNER)
 
     # Get API key from user
     api_key = input("Enter your Alpha Vantage API key: ").strip()
@@ -205,6 +759,15 @@ def main():
     # Initialize scanner
     scanner = ForexScanner(api_key)
 
+    try:
+        _run_scan(scanner)
+    finally:
+        scanner.close()
+
+
+def _run_scan(scanner: 'ForexScanner'):
+    """Run the interactive scan workflow for the given scanner"""
+
     # Define currency pairs to scan
     # Popular major pairs
     currency_pairs = [
@@ -219,7 +782,7 @@ def main():
     for from_curr, to_curr in currency_pairs:
         print(f"   • {from_curr}/{to_curr}")
 
-    print("\n⏳ Note: Free API tier allows 5 calls/minute (12 sec delay between calls)")
+    print("\n⏳ Note: Free API tier allows 5 calls/minute (requests are paced automatically)")
 
     proceed = input("\nProceed with scan? (y/n): ").strip().lower()
 
@@ -228,7 +791,7 @@ def main():
         return
 
     # Scan the pairs
-    results = scanner.scan_pairs(currency_pairs, delay=12.0)
+    results = scanner.scan_pairs(currency_pairs)
 
     # Display results
     scanner.display_results(results)